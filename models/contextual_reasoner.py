@@ -4,18 +4,45 @@ The function ``reason_about_signal`` shows how an application could inject
 sensor features and scenario priors into the ``SuperpositionMemory`` class.
 It keeps the example deterministic and numerically stable while still
 illustrating the qualitative behaviour described in the whitepaper.
+``reason_about_signal_batch`` applies the same procedure to a sequence of
+sensor snapshots that share one set of priors, and ``reason_about_signal_fast``
+is a specialised variant for the fixed three-hypothesis demo schema.
 """
 
 from __future__ import annotations
 
-from typing import Dict, Iterable
+import math
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from .superposition_memory import Hypothesis, SuperpositionMemory
 
+# Contextual weight adjustment contributed by each known sensor feature.
+_FEATURE_DELTAS: Dict[str, Tuple[str, float]] = {
+    # Reliability increases, penalise the sensor fault interpretation.
+    "redundant_sensor_agreement": ("sensor fault", -0.25),
+    "external_heat_source": ("thermal anomaly", 0.35),
+    "maintenance_recently_completed": ("benign fluctuation", 0.20),
+}
+
+# Hypotheses that always receive an explicit (initially neutral) weight.
+_CONTEXT_LABELS = ("thermal anomaly", "sensor fault", "benign fluctuation")
+
+# Bit flags identifying the known features for ``reason_about_signal_fast``.
+FEATURE_REDUNDANT_SENSOR_AGREEMENT = 1
+FEATURE_EXTERNAL_HEAT_SOURCE = 2
+FEATURE_MAINTENANCE_RECENTLY_COMPLETED = 4
+
+_SENSOR_FAULT_DELTA = _FEATURE_DELTAS["redundant_sensor_agreement"][1]
+_THERMAL_ANOMALY_DELTA = _FEATURE_DELTAS["external_heat_source"][1]
+_BENIGN_FLUCTUATION_DELTA = _FEATURE_DELTAS["maintenance_recently_completed"][1]
+
 
 def reason_about_signal(
     priors: Dict[str, float],
     sensor_features: Iterable[str],
+    *,
+    memory: Optional[SuperpositionMemory] = None,
 ) -> Hypothesis:
     """Fuse priors and feature cues to pick the most plausible hypothesis.
 
@@ -23,10 +50,15 @@ def reason_about_signal(
     ----------
     priors:
         Mapping from hypothesis label to prior probability mass.  Values do not
-        need to sum to one; they are normalised automatically.
+        need to sum to one; they are normalised automatically.  Negative
+        priors raise ``ValueError``.
     sensor_features:
         Iterable of feature names extracted from a sensor snapshot.  The
         function maps these to contextual weights that bias the superposition.
+    memory:
+        Optional ``SuperpositionMemory(real=True)`` instance to reuse.  It is
+        reset before the priors are registered, which lets high-frequency
+        callers avoid allocating a new memory on every call.
 
     Returns
     -------
@@ -34,38 +66,162 @@ def reason_about_signal(
         The hypothesis favoured by the contextual collapse procedure.
     """
 
-    memory = SuperpositionMemory()
+    # Priors are real probability masses, so skip the amplitude round trip.
+    if memory is None:
+        memory = SuperpositionMemory(real=True)
+    elif not memory.real:
+        raise ValueError("reason_about_signal requires a SuperpositionMemory(real=True)")
+    else:
+        memory.reset()
     for label, prior in priors.items():
-        memory.add(label, prior ** 0.5)
-
-    memory.normalise()
+        memory.add(label, prior)
 
-    context_weights = _feature_to_context(sensor_features)
-    winner = memory.collapse(context=context_weights.items())
+    # Collapse is scale invariant, so only the winner needs normalising.
+    context_weights = _context_for(sensor_features)
+    winner = memory.collapse(context=context_weights, normalise_output=True)
     return winner
 
 
+def reason_about_signal_batch(
+    priors: Dict[str, float],
+    feature_snapshots: Iterable[Iterable[str]],
+) -> List[Hypothesis]:
+    """Apply :func:`reason_about_signal` to a sequence of sensor snapshots.
+
+    All snapshots share the same priors, so the superposition is built once
+    and only the contextual collapse is repeated per snapshot.
+
+    Parameters
+    ----------
+    priors:
+        Mapping from hypothesis label to prior probability mass, shared by
+        every snapshot.  Negative priors raise ``ValueError``.
+    feature_snapshots:
+        Iterable with one iterable of feature names per sensor snapshot.
+
+    Returns
+    -------
+    list of Hypothesis
+        The favoured hypothesis for each snapshot, in input order.
+    """
+
+    memory = SuperpositionMemory(real=True)
+    for label, prior in priors.items():
+        memory.add(label, prior)
+
+    return [
+        memory.collapse(
+            context=_context_for(features), normalise_output=True
+        )
+        for features in feature_snapshots
+    ]
+
+
+def reason_about_signal_fast(
+    p_thermal_anomaly: float,
+    p_sensor_fault: float,
+    p_benign_fluctuation: float,
+    flags: int,
+) -> Hypothesis:
+    """Specialised :func:`reason_about_signal` for the fixed demo schema.
+
+    The three demo hypotheses and the three known features are hard-wired, so
+    the collapse reduces to a handful of float operations and two comparisons
+    with no memory or context mapping being built.
+
+    Parameters
+    ----------
+    p_thermal_anomaly, p_sensor_fault, p_benign_fluctuation:
+        Prior probability masses of the three demo hypotheses.  Values do not
+        need to sum to one; the returned probability is normalised.  Negative
+        priors raise ``ValueError``.
+    flags:
+        Bitwise OR of the ``FEATURE_*`` constants present in the snapshot.
+        Unlike the generic path each feature counts at most once.
+
+    Returns
+    -------
+    Hypothesis
+        The same hypothesis :func:`reason_about_signal` selects for priors
+        given in the order above.
+    """
+
+    if p_thermal_anomaly < 0 or p_sensor_fault < 0 or p_benign_fluctuation < 0:
+        raise ValueError("Prior probability masses must be non-negative")
+
+    s_thermal_anomaly = p_thermal_anomaly
+    if flags & FEATURE_EXTERNAL_HEAT_SOURCE:
+        s_thermal_anomaly *= 1.0 + _THERMAL_ANOMALY_DELTA
+    s_sensor_fault = p_sensor_fault
+    if flags & FEATURE_REDUNDANT_SENSOR_AGREEMENT:
+        s_sensor_fault *= 1.0 + _SENSOR_FAULT_DELTA
+    s_benign_fluctuation = p_benign_fluctuation
+    if flags & FEATURE_MAINTENANCE_RECENTLY_COMPLETED:
+        s_benign_fluctuation *= 1.0 + _BENIGN_FLUCTUATION_DELTA
+
+    # Ties resolve to the earlier hypothesis, matching the generic collapse.
+    if s_thermal_anomaly >= s_sensor_fault and s_thermal_anomaly >= s_benign_fluctuation:
+        label, probability = "thermal anomaly", p_thermal_anomaly
+    elif s_sensor_fault >= s_benign_fluctuation:
+        label, probability = "sensor fault", p_sensor_fault
+    else:
+        label, probability = "benign fluctuation", p_benign_fluctuation
+
+    # Same total and reciprocal scaling as ``SuperpositionMemory.collapse``.
+    total_probability = math.fsum((p_thermal_anomaly, p_sensor_fault, p_benign_fluctuation))
+    if total_probability == 0:
+        raise ValueError("Cannot normalise an empty or zero-amplitude state")
+    probability = probability * (1.0 / total_probability)
+    return Hypothesis(label, probability ** 0.5)
+
+
 def _feature_to_context(features: Iterable[str]) -> Dict[str, float]:
     """Translate simple feature flags into contextual weight adjustments."""
 
-    weights: Dict[str, float] = {
-        "thermal anomaly": 0.0,
-        "sensor fault": 0.0,
-        "benign fluctuation": 0.0,
-    }
+    weights: Dict[str, float] = dict.fromkeys(_CONTEXT_LABELS, 0.0)
 
     for feature in features:
-        if feature == "redundant_sensor_agreement":
-            # Reliability increases, penalise the sensor fault interpretation.
-            weights["sensor fault"] -= 0.25
-        elif feature == "external_heat_source":
-            weights["thermal anomaly"] += 0.35
-        elif feature == "maintenance_recently_completed":
-            weights["benign fluctuation"] += 0.20
+        try:
+            delta = _FEATURE_DELTAS.get(feature)
+        except TypeError:
+            # Unhashable values cannot name a known feature; ignore them like
+            # any other unknown feature.
+            continue
+        if delta is not None:
+            label, adjustment = delta
+            weights[label] += adjustment
 
     return weights
 
 
+@lru_cache(maxsize=256)
+def _cached_context(features: Tuple[str, ...]) -> Tuple[Tuple[str, float], ...]:
+    """Memoised :func:`_feature_to_context` for recurring feature sequences.
+
+    The weights are returned as immutable ``(label, weight)`` pairs because
+    the result is shared between callers.
+    """
+
+    return tuple(_feature_to_context(features).items())
+
+
+def _context_for(features: Iterable[str]) -> Iterable[Tuple[str, float]]:
+    """Return the context weights for ``features``, cached when possible.
+
+    The features are used in the given order as the cache key.  Weights are
+    summed, so order does not change the result; the same features in a
+    different order just occupy another cache entry.  Feature sequences that
+    contain unhashable values cannot be cached and are translated directly,
+    keeping the baseline leniency towards unknown inputs.
+    """
+
+    key = tuple(features)
+    try:
+        return _cached_context(key)
+    except TypeError:
+        return _feature_to_context(key).items()
+
+
 if __name__ == "__main__":
     result = reason_about_signal(
         priors={
@@ -16,35 +16,114 @@ risks.  All math fits in standard Python and NumPy is not required.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, Iterable, List, Tuple
+import math
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Tuple, Union
 
 
-@dataclass(frozen=True)
 class Hypothesis:
-    """Container that stores a hypothesis label and its complex amplitude."""
+    """Container that stores a hypothesis label and its complex amplitude.
+
+    Instances are immutable.  The Born-rule style probability mass is computed
+    once at construction and stored alongside the amplitude, so ranking code
+    can read it as a plain slot instead of recomputing it on every access.
+    Instances can be pickled and copied, but since the class is not a
+    dataclass ``dataclasses.asdict`` and ``dataclasses.replace`` do not apply.
+    """
+
+    __slots__ = ("label", "amplitude", "probability")
 
     label: str
     amplitude: complex
+    probability: float
 
-    @property
-    def probability(self) -> float:
-        """Return the Born-rule style probability mass of the hypothesis."""
+    def __init__(self, label: str, amplitude: complex) -> None:
+        object.__setattr__(self, "label", label)
+        object.__setattr__(self, "amplitude", amplitude)
+        object.__setattr__(self, "probability", (amplitude.conjugate() * amplitude).real)
+
+    @classmethod
+    def _from_parts(cls, label: str, amplitude: complex, probability: float) -> Hypothesis:
+        """Build an instance from an already computed ``|amplitude| ** 2``.
+
+        ``probability`` must be exactly ``(amplitude.conjugate() * amplitude).real``
+        so instances that compare equal also report the same probability.
+        """
+
+        hypothesis = object.__new__(cls)
+        object.__setattr__(hypothesis, "label", label)
+        object.__setattr__(hypothesis, "amplitude", amplitude)
+        object.__setattr__(hypothesis, "probability", probability)
+        return hypothesis
 
-        return (self.amplitude.conjugate() * self.amplitude).real
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"cannot delete field {name!r}")
+
+    def __reduce__(self) -> Tuple[type, Tuple[str, complex]]:
+        # The default slots state restore goes through ``__setattr__``, so
+        # rebuild through ``__init__`` for pickle and ``copy`` instead.
+        return (Hypothesis, (self.label, self.amplitude))
+
+    def __repr__(self) -> str:
+        return f"Hypothesis(label={self.label!r}, amplitude={self.amplitude!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.label, self.amplitude) == (other.label, other.amplitude)
+
+    def __hash__(self) -> int:
+        return hash((self.label, self.amplitude))
 
 
 class SuperpositionMemory:
     """Store and collapse hypotheses as described in the HNQA whitepaper.
 
+    Parameters
+    ----------
+    real:
+        When ``True`` the memory stores real probability masses instead of
+        complex amplitudes.  Applications that only ever register real priors
+        never observe the phase of an amplitude, so this mode skips the
+        ``conjugate() * amplitude`` reduction on every code path.  ``add``
+        then accumulates probability mass rather than amplitudes and rejects
+        negative masses.
+
     Attributes
     ----------
     hypotheses:
-        Mapping from hypothesis label to complex amplitude.
+        Mapping from hypothesis label to complex amplitude, or to probability
+        mass when the memory was created with ``real=True``.  The mapping is a
+        read-only snapshot, so attempts to modify it raise an error; use
+        :meth:`add` and :meth:`reset` to modify the state.
+
+    Notes
+    -----
+    Internally the state is kept as parallel sequences of labels and
+    amplitudes plus a ``label -> position`` index, so the hot loops walk two
+    flat lists instead of iterating over dictionary items.
     """
 
-    def __init__(self) -> None:
-        self.hypotheses: Dict[str, complex] = {}
+    def __init__(self, real: bool = False) -> None:
+        self._real = real
+        self._labels: List[str] = []
+        self._amplitudes: List[complex] = []
+        self._index: Dict[str, int] = {}
+
+    @property
+    def real(self) -> bool:
+        """Return whether the memory stores real probability masses."""
+
+        return self._real
+
+    @property
+    def hypotheses(self) -> Mapping[str, Union[complex, float]]:
+        """Return a read-only ``label -> amplitude`` snapshot of the state."""
+
+        return MappingProxyType(dict(zip(self._labels, self._amplitudes)))
 
     # ---------------------------------------------------------------------
     # State management
@@ -53,40 +132,72 @@ class SuperpositionMemory:
         """Add a hypothesis with the given amplitude.
 
         If the label already exists the amplitudes are summed, mirroring the
-        constructive interference behaviour discussed in the whitepaper.
+        constructive interference behaviour discussed in the whitepaper.  In
+        ``real`` mode ``amplitude`` is interpreted as probability mass and the
+        masses are summed instead; a negative mass raises ``ValueError``.
         """
 
-        if label in self.hypotheses:
-            self.hypotheses[label] += amplitude
+        if self._real and amplitude < 0:
+            raise ValueError(f"Probability mass for {label!r} must be non-negative")
+
+        index = self._index.get(label)
+        if index is None:
+            self._index[label] = len(self._labels)
+            self._labels.append(label)
+            self._amplitudes.append(amplitude)
         else:
-            self.hypotheses[label] = amplitude
+            self._amplitudes[index] += amplitude
+
+    def _total_probability(self) -> float:
+        """Return the total probability mass of the stored state."""
+
+        # ``math.fsum`` keeps the total correctly rounded for ill-conditioned
+        # states, e.g. one dominant hypothesis next to many tiny ones.
+        if self._real:
+            return math.fsum(self._amplitudes)
+        return math.fsum([(amp.conjugate() * amp).real for amp in self._amplitudes])
 
     def normalise(self) -> None:
         """Scale amplitudes such that their probability mass sums to one."""
 
-        total_probability = sum(
-            (amp.conjugate() * amp).real for amp in self.hypotheses.values()
-        )
+        amplitudes = self._amplitudes
+        total_probability = self._total_probability()
         if total_probability == 0:
             raise ValueError("Cannot normalise an empty or zero-amplitude state")
 
-        scale = total_probability ** 0.5
-        for label, amplitude in list(self.hypotheses.items()):
-            self.hypotheses[label] = amplitude / scale
+        # Probability masses scale linearly, amplitudes by the square root.
+        scale = total_probability if self._real else total_probability ** 0.5
+        # Multiplying by the reciprocal avoids a complex division per element.
+        inv_scale = 1.0 / scale
+        amplitudes[:] = [amplitude * inv_scale for amplitude in amplitudes]
 
     # ---------------------------------------------------------------------
     # Collapse heuristics
     # ---------------------------------------------------------------------
-    def collapse(self, context: Iterable[Tuple[str, float]]) -> Hypothesis:
+    def collapse(
+        self,
+        context: Union[Mapping[str, float], Iterable[Tuple[str, float]], None] = None,
+        normalise_output: bool = False,
+    ) -> Hypothesis:
         """Collapse the superposition using a contextual weighting scheme.
 
+        The winner is invariant under scaling all amplitudes by a common
+        factor, so the state does not need to be normalised beforehand.
+
         Parameters
         ----------
         context:
-            Iterable of ``(label, weight)`` pairs.  The weight represents the
-            strength of contextual support for the corresponding hypothesis.  A
-            weight of zero expresses neutrality.  Hypotheses missing from the
-            context default to zero weight.
+            Mapping from label to weight, or an iterable of ``(label, weight)``
+            pairs.  The weight represents the strength of contextual support
+            for the corresponding hypothesis.  A weight of zero expresses
+            neutrality.  Hypotheses missing from the context default to zero
+            weight, and ``None`` collapses on probability alone.
+        normalise_output:
+            When ``True`` the returned hypothesis is expressed relative to the
+            total probability mass.  Its amplitude and probability are computed
+            with the same arithmetic as :meth:`normalise`, so they match that
+            hypothesis in a normalised state.  The internal state is left
+            untouched.
 
         Returns
         -------
@@ -97,20 +208,60 @@ class SuperpositionMemory:
             and negative weights penalise hypotheses.
         """
 
-        if not self.hypotheses:
+        if not self._labels:
             raise ValueError("Cannot collapse an empty superposition state")
 
-        weight_map = {label: weight for label, weight in context}
-        scored: List[Tuple[float, Hypothesis]] = []
-
-        for label, amplitude in self.hypotheses.items():
-            probability = (amplitude.conjugate() * amplitude).real
-            weight = weight_map.get(label, 0.0)
+        # Resolve context labels to positions once, so the scoring loop reads
+        # a dense weight list instead of hashing every hypothesis label.
+        index = self._index
+        weights = [0.0] * len(self._labels)
+        if context is not None:
+            pairs = context.items() if isinstance(context, Mapping) else context
+            for label, weight in pairs:
+                position = index.get(label)
+                if position is not None:
+                    weights[position] = weight
+
+        # Only the top-ranked hypothesis is returned, so track the running
+        # maximum instead of materialising and sorting every score.  The strict
+        # comparison keeps the first of several equally scored hypotheses.
+        real = self._real
+        if real:
+            probabilities = self._amplitudes
+        else:
+            # Kept over ``a.real * a.real + a.imag * a.imag``: on CPython the
+            # single C-level complex multiply beats four attribute loads, and
+            # ``abs(a) ** 2`` is both slower and rounds worse.
+            probabilities = [(amp.conjugate() * amp).real for amp in self._amplitudes]
+
+        best_score = -math.inf
+        best_position = 0
+        best_probability = 0.0
+        for position, (probability, weight) in enumerate(zip(probabilities, weights)):
             score = probability * (1.0 + weight)
-            scored.append((score, Hypothesis(label=label, amplitude=amplitude)))
-
-        scored.sort(key=lambda item: item[0], reverse=True)
-        return scored[0][1]
+            if score > best_score:
+                best_score = score
+                best_position = position
+                best_probability = probability
+
+        if normalise_output:
+            total_probability = self._total_probability()
+            if total_probability == 0:
+                raise ValueError("Cannot normalise an empty or zero-amplitude state")
+
+        # Only the winner is looked up and materialised as a ``Hypothesis``.
+        # Normalising it mirrors the arithmetic of :meth:`normalise` exactly.
+        label = self._labels[best_position]
+        if real:
+            if normalise_output:
+                best_probability = best_probability * (1.0 / total_probability)
+            return Hypothesis(label, best_probability ** 0.5)
+
+        best_amplitude = self._amplitudes[best_position]
+        if normalise_output:
+            best_amplitude = best_amplitude * (1.0 / total_probability ** 0.5)
+            best_probability = (best_amplitude.conjugate() * best_amplitude).real
+        return Hypothesis._from_parts(label, best_amplitude, best_probability)
 
     # ------------------------------------------------------------------
     # Convenience utilities
@@ -118,14 +269,29 @@ class SuperpositionMemory:
     def as_ranked_list(self) -> List[Hypothesis]:
         """Return hypotheses sorted by probability mass."""
 
-        ranked = [Hypothesis(label, amplitude) for label, amplitude in self.hypotheses.items()]
-        ranked.sort(key=lambda hyp: hyp.probability, reverse=True)
-        return ranked
+        labels = self._labels
+        amplitudes = self._amplitudes
+        if self._real:
+            probabilities = amplitudes
+        else:
+            probabilities = [(amp.conjugate() * amp).real for amp in amplitudes]
+
+        # Sort positions on the flat probability list (an argsort) so the key
+        # is a direct list lookup and hypotheses are built already in order.
+        order = sorted(range(len(labels)), key=probabilities.__getitem__, reverse=True)
+        if self._real:
+            return [Hypothesis(labels[i], probabilities[i] ** 0.5) for i in order]
+        return [
+            Hypothesis._from_parts(labels[i], amplitudes[i], probabilities[i])
+            for i in order
+        ]
 
     def reset(self) -> None:
         """Clear the internal state.  Useful in small experiments."""
 
-        self.hypotheses.clear()
+        self._labels.clear()
+        self._amplitudes.clear()
+        self._index.clear()
 
 
 def run_demo() -> List[Hypothesis]:
@@ -142,7 +308,7 @@ def run_demo() -> List[Hypothesis]:
     memory.add("sensor fault", 0.3)
     memory.add("benign fluctuation", 0.1)
     memory.normalise()
-    memory.collapse(context=[("thermal anomaly", 0.2)])
+    memory.collapse(context={"thermal anomaly": 0.2})
     return memory.as_ranked_list()
 
 